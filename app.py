@@ -19,39 +19,72 @@ Usage:
     python app.py
 """
 
+import asyncio
+import errno
+import functools
 import os
 import platform
+import select
 import shutil
 import subprocess
 import sys
 import threading
 import time
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
-import yaml
-from watchdog.events import FileSystemEventHandler
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+from watchdog.events import (
+    EVENT_TYPE_CLOSED,
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_MOVED,
+    DirCreatedEvent,
+    DirMovedEvent,
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileMovedEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
 # Extensions used by browsers for incomplete downloads
 TEMP_EXTENSIONS = {'.crdownload', '.part', '.download', '.partial', '.tmp'}
 
+# How long a lone new file waits before being checked when nothing else is going on
+FIRST_EVENT_DELAY_NS = 50_000_000  # 50ms
+
+# How long a file waits after its writer closes it, in case it's reopened or
+# replaced (Firefox renames the finished download over an empty placeholder)
+CLOSE_GRACE_NS = 300_000_000  # 300ms
+
+# Stored in DownloadHandler.sizes when a file was written to after its size was taken
+SIZE_STALE = -2
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-CONFIG_PATH = Path(__file__).parent / "config.yaml"
+CONFIG_PATH = Path(__file__).parent / "config.toml"
 
 
+@functools.cache
 def load_config() -> dict:
     """
-    Load configuration from config.yaml.
+    Load configuration from config.toml.
+
+    The file is only read once per process; later calls return the same dict.
 
     Returns:
         dict: Configuration with watch_folder and categories
     """
-    with open(CONFIG_PATH) as f:
-        return yaml.safe_load(f)
+    with open(CONFIG_PATH, "rb") as f:
+        return tomllib.load(f)
 
 
 def build_extension_map(categories: dict) -> dict[str, str]:
@@ -73,10 +106,153 @@ def build_extension_map(categories: dict) -> dict[str, str]:
     return ext_map
 
 
+def build_category_folders(watch_folder: Path, ext_map: dict[str, str]) -> dict[str, Path]:
+    """
+    Build the destination folder for every category, including "Other".
+
+    Categories are fixed once the config is loaded, so these paths are
+    built once instead of joining watch_folder / category for every move.
+
+    Returns:
+        Dict mapping category names to folders
+        e.g., {"Images": ~/Downloads/Images, "Other": ~/Downloads/Other}
+    """
+    return {category: watch_folder / category for category in {*ext_map.values(), "Other"}}
+
+
+def _ext_of(name: str) -> str:
+    """
+    Return the lowercased extension of a file name, e.g. "Photo.JPG" -> ".jpg".
+
+    Matches Path.suffix: hidden names like ".bashrc" and names ending in a
+    dot have no extension. Slices the name directly instead of building a
+    Path for it.
+    """
+    i = name.rfind(".")
+    if i <= 0 or i == len(name) - 1:
+        return ""
+    return name[i:].lower()
+
+
 # =============================================================================
 # FILE SYSTEM WATCHER
 # =============================================================================
 
+def _unique_dest(dest_folder: Path, name: str, existing: Optional[set[str]] = None) -> Path:
+    """
+    Pick a destination path in dest_folder that doesn't clash with an existing file.
+
+    Reads the folder listing once instead of stat-ing every candidate name.
+
+    Args:
+        dest_folder: Category folder the file is moving into
+        name: Original file name, e.g. "file.pdf"
+        existing: Casefolded names already in dest_folder, when moving a batch.
+                  The chosen name is added to it.
+
+    Returns:
+        dest_folder / name, or dest_folder / "file_1.pdf", "file_2.pdf", ...
+    """
+    # Compare case-insensitively: macOS and Windows filesystems usually are
+    if existing is None:
+        existing = _list_names(dest_folder)
+
+    dest_name = name
+    if name.casefold() in existing:
+        # Handle duplicate filenames: file.pdf -> file_1.pdf -> file_2.pdf
+        stem, ext = os.path.splitext(name)
+        counter = 1
+        while f"{stem}_{counter}{ext}".casefold() in existing:
+            counter += 1
+        dest_name = f"{stem}_{counter}{ext}"
+
+    existing.add(dest_name.casefold())
+    return dest_folder / dest_name
+
+
+def _list_names(folder: Path) -> set[str]:
+    """
+    Return the casefolded names of everything in a folder, creating it if needed.
+
+    The listing doubles as the existence check, so a category folder that's
+    already there never costs a mkdir call.
+    """
+    try:
+        with os.scandir(folder) as it:
+            return {entry.name.casefold() for entry in it}
+    except FileNotFoundError:
+        folder.mkdir(exist_ok=True)
+        return set()
+
+
+def _move(src: Path, dest: Path):
+    """
+    Move a file, renaming it in place when possible.
+
+    Category folders live inside the watch folder, so this is almost always
+    a single rename. shutil.move is only needed across filesystems.
+    """
+    try:
+        os.rename(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dest))
+
+
+def _move_to_categories(
+    folder: Path,
+    names: list[str],
+    ext_map: dict[str, str],
+    cat_folders: dict[str, Path]
+) -> tuple[list[tuple[Path, str]], list[str]]:
+    """
+    Move files from folder into its category subfolders.
+
+    Files are grouped by category first, so each category folder is created
+    and listed once no matter how many files go into it. A file that can't
+    be moved (e.g. still held open by antivirus on Windows) doesn't stop
+    the rest of the batch.
+
+    Args:
+        folder: Folder containing the files (e.g., ~/Downloads)
+        names: Names of the files in folder to move
+        ext_map: Mapping of file extensions to category names
+        cat_folders: Destination folder for each category
+
+    Returns:
+        (moved, failed): (dest_path, category) for every file moved, and
+        the names of the files that couldn't be moved
+    """
+    by_category: dict[str, list[str]] = {}
+    for name in names:
+        by_category.setdefault(ext_map.get(_ext_of(name), "Other"), []).append(name)
+
+    moved = []
+    failed = []
+    for category, category_names in by_category.items():
+        dest_folder = cat_folders[category]
+
+        # Creates the category folder if it doesn't exist
+        try:
+            existing = _list_names(dest_folder)
+        except OSError:
+            failed.extend(category_names)
+            continue
+
+        for name in category_names:
+            dest_path = _unique_dest(dest_folder, name, existing)
+            try:
+                _move(folder / name, dest_path)
+            except OSError:
+                existing.discard(dest_path.name.casefold())
+                failed.append(name)
+                continue
+            moved.append((dest_path, category))
+
+    return moved, failed
+
+
 class DownloadHandler(FileSystemEventHandler):
     """
     Watches for new files and moves them to appropriate category folders.
@@ -87,15 +263,22 @@ class DownloadHandler(FileSystemEventHandler):
     Attributes:
         watch_folder: The folder being monitored (e.g., ~/Downloads)
         ext_map: Maps file extensions to category names
+        cat_folders: Destination folder for each category
         debounce: Seconds to wait after last file modification
-        pending: Files waiting to be moved {path: (timestamp, size)}
+        pending: Files waiting to be moved {path: deadline} (time.monotonic_ns)
+        sizes: Size of each pending file when it was last checked {path: size},
+               or SIZE_STALE if it has been modified since
+        _handles: asyncio timer for each pending file, on the handler's own event loop
         on_file_moved: Callback function when a file is moved
+        modified_events: Whether the observer reports modifications (the
+                         first-event shortcut relies on them)
     """
 
     def __init__(
         self,
         watch_folder: Path,
         ext_map: dict[str, str],
+        cat_folders: dict[str, Path],
         debounce: float,
         on_file_moved: Optional[callable] = None
     ):
@@ -105,141 +288,351 @@ class DownloadHandler(FileSystemEventHandler):
         Args:
             watch_folder: Directory to monitor for new files
             ext_map: Mapping of file extensions to category names
+            cat_folders: Destination folder for each category, from build_category_folders
             debounce: Seconds to wait for file to stabilize before moving
-            on_file_moved: Optional callback(dest_path, category) when file is moved
+            on_file_moved: Optional callback([(dest_path, category), ...]) after each
+                           batch of files is moved
         """
         self.watch_folder = watch_folder
         self.watch_folder_str = str(watch_folder.resolve())
+        self._watch_prefix = os.path.join(self.watch_folder_str, "")  # with trailing separator
         self.ext_map = ext_map
+        self.cat_folders = cat_folders
         self.debounce = debounce
+        self.debounce_ns = int(debounce * 1e9)
         self.on_file_moved = on_file_moved
-        self.pending: dict[str, tuple[float, int]] = {}  # filepath → (timestamp, size)
-
-    def on_created(self, event):
+        self.modified_events = True  # cleared by observers that never send them
+        self.pending: dict[str, int] = {}  # filepath → deadline
+        self.sizes: dict[str, int] = {}  # filepath → size
+        self._lock = threading.Lock()  # guards pending, sizes and _last_flush
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._handles: dict[str, asyncio.TimerHandle] = {}  # filepath → timer
+        self._due: list[str] = []  # files whose timer fired, waiting for process_pending
+        self._last_flush = -self.debounce_ns  # when files were last moved
+
+    def dispatch(self, event):
         """
-        Called when a new file is created in the watch folder.
-
-        Adds the file to pending list but doesn't move it yet.
-        We wait for the debounce period to ensure download is complete.
+        Called by the observer for every file system event.
+
+        Replaces FileSystemEventHandler.dispatch, which calls on_any_event and
+        then looks up an on_<event_type> method for every single event.
+        Modifications come first since downloads produce far more of those
+        than anything else.
+
+        - modified: pushes back the deadline of a pending file
+        - created: adds the file to the pending list; it's moved once it
+          stops changing for the debounce period
+        - closed (Linux only): the writer is done, check the file after a
+          short grace period in case it's reopened or replaced
+        - moved: browsers rename "report.pdf.crdownload" to "report.pdf" once
+          the download is complete, check the file right away
         """
         if event.is_directory:
             return
 
-        filepath = event.src_path
-        filename = os.path.basename(filepath)
-        parent = os.path.dirname(filepath)
+        event_type = event.event_type
+        if event_type == EVENT_TYPE_MODIFIED:
+            # Only pushes back the deadline and marks the size stale: the
+            # file's timer re-arms itself when it finds a newer deadline, and
+            # the size is taken once the file goes quiet
+            filepath = event.src_path
+            if filepath in self.pending:
+                with self._lock:
+                    if filepath in self.pending:
+                        self.pending[filepath] = time.monotonic_ns() + self.debounce_ns
+                        self.sizes[filepath] = SIZE_STALE
+        elif event_type == EVENT_TYPE_CREATED:
+            if self._should_track(event.src_path):
+                self._track(event.src_path, self.debounce_ns, self.modified_events)
+        elif event_type == EVENT_TYPE_CLOSED:
+            if self._should_track(event.src_path):
+                self._track(event.src_path, CLOSE_GRACE_NS)
+        elif event_type == EVENT_TYPE_MOVED:
+            if self._should_track(event.dest_path):
+                self._track(event.dest_path, 0)
+
+    def _should_track(self, filepath: str) -> bool:
+        """
+        Check whether a file in an event is one we organize.
 
+        Runs for every event, so it sticks to plain string operations.
+        Event paths are built from the path we scheduled, so a prefix
+        check is enough to tell whether the file sits in the watch folder.
+        """
         # Only watch root of Downloads, ignore files in subfolders
-        if os.path.normcase(os.path.normpath(parent)) != os.path.normcase(os.path.normpath(self.watch_folder_str)):
-            return
+        if not filepath.startswith(self._watch_prefix):
+            return False
+        filename = filepath[len(self._watch_prefix):]
+        if os.sep in filename:
+            return False
 
         # Ignore hidden files (like .DS_Store)
         if filename.startswith("."):
-            return
+            return False
 
         # Ignore temporary download files (incomplete downloads)
-        ext = os.path.splitext(filename)[1].lower()
-        if ext in TEMP_EXTENSIONS:
-            return
+        return _ext_of(filename) not in TEMP_EXTENSIONS
 
-        # Track with timestamp and file size for stability check
+    def _track(self, filepath: str, delay_ns: int, shortcut: bool = False):
+        """
+        Add a file to the pending list, to be checked after `delay_ns` nanoseconds.
+
+        With `shortcut`, the first file after a quiet spell only waits
+        FIRST_EVENT_DELAY_NS, so a single download is organized immediately
+        while bursts of files are still debounced together. This is only
+        safe when modified events will push the deadline back if the file
+        is still being written. Empty or unreadable files always wait
+        the full debounce period, since their writer has most likely just
+        started (or left a placeholder to be replaced later).
+        """
+        # Track with deadline and file size for stability check
         try:
             size = os.path.getsize(filepath)
         except OSError:
             size = -1
-        self.pending[filepath] = (time.time(), size)
 
-    def on_modified(self, event):
+        with self._lock:
+            if self._closed:
+                return
+
+            now = time.monotonic_ns()
+            if (
+                shortcut
+                and delay_ns > FIRST_EVENT_DELAY_NS
+                and size > 0
+                and not self.pending
+                and now - self._last_flush >= self.debounce_ns
+            ):
+                delay_ns = FIRST_EVENT_DELAY_NS
+            elif size <= 0:
+                delay_ns = max(delay_ns, self.debounce_ns)
+
+            deadline = now + delay_ns
+            old_deadline = self.pending.get(filepath)
+            self.pending[filepath] = deadline
+            self.sizes[filepath] = size
+            if old_deadline is None or deadline < old_deadline:
+                self._loop.call_soon_threadsafe(self._schedule, filepath, deadline)
+
+    def start(self):
+        """Start the event loop thread that runs the debounce timers."""
+        self._thread.start()
+
+    def close(self):
+        """Stop the event loop; nothing is processed after this."""
+        with self._lock:
+            self._closed = True
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+
+    def _schedule(self, filepath: str, deadline: int):
         """
-        Called when a file is modified.
+        Check a pending file at `deadline` (event loop thread only).
 
-        Resets the debounce timer for pending files.
-        This ensures we wait for downloads to fully complete.
+        Keeps one timer per file; it is only replaced when the file becomes
+        due sooner. Later deadlines are picked up when the timer fires.
         """
-        if event.is_directory:
+        handle = self._handles.get(filepath)
+        if handle is not None:
+            if handle.when() <= deadline / 1e9:
+                return
+            handle.cancel()
+
+        # The loop's clock is time.monotonic(), same as our deadlines
+        self._handles[filepath] = self._loop.call_at(deadline / 1e9, self._on_due, filepath)
+
+    def _on_due(self, filepath: str):
+        """Timer callback: queue the file for the next batch if it's still quiet."""
+        del self._handles[filepath]
+        with self._lock:
+            deadline = self.pending.get(filepath)
+        if deadline is None:
+            return  # Already moved or gone
+
+        # Skip if file was recently modified (still downloading)
+        if deadline > time.monotonic_ns():
+            self._schedule(filepath, deadline)
             return
 
-        filepath = event.src_path
-        if filepath in self.pending:
-            try:
-                size = os.path.getsize(filepath)
-            except OSError:
-                size = -1
-            self.pending[filepath] = (time.time(), size)
+        # Files whose timers fire in the same loop iteration share one batch
+        self._due.append(filepath)
+        if len(self._due) == 1:
+            self._loop.call_soon(self.process_pending)
 
     def process_pending(self):
         """
         Move files that have been stable for the debounce period.
 
-        Called periodically to check if any pending files are ready to move.
+        Runs on the event loop right after the timers of one or more files fire.
         A file is ready when it hasn't been modified for `debounce` seconds
+        (or shortly after its writer closed it / it was renamed into place)
         AND its file size hasn't changed (ensures download is complete).
-        """
-        now = time.time()
-        to_remove = []
 
-        for filepath, (last_modified, last_size) in list(self.pending.items()):
-            # Skip if file was recently modified (still downloading)
-            if now - last_modified < self.debounce:
-                continue
+        All files that become ready together are moved as one batch.
+        """
+        due, self._due = self._due, []
 
-            # Check if file still exists
-            if not os.path.exists(filepath):
-                to_remove.append(filepath)
-                continue
+        ready: dict[Path, tuple[str, int]] = {}  # path → (filepath, size)
+        for filepath in due:
+            with self._lock:
+                last_size = self.sizes.get(filepath)
+            if last_size is None:
+                continue  # Already moved or gone
 
             # Verify file size is stable (catches downloads still in progress)
             try:
                 current_size = os.path.getsize(filepath)
+            except FileNotFoundError:
+                self._forget(filepath)  # Deleted or moved away
+                continue
             except OSError:
-                continue  # Can't read size, skip for now
+                current_size = -1  # Can't read size, check again later
 
-            if current_size != last_size:
+            if last_size == SIZE_STALE:
+                # Written to since the last snapshot: take one now and
+                # compare against it shortly instead of waiting out another
+                # full debounce period
+                self._requeue(filepath, current_size, FIRST_EVENT_DELAY_NS)
+                continue
+
+            if current_size != last_size or current_size < 0:
                 # Size changed - reset timer with new size
-                self.pending[filepath] = (time.time(), current_size)
+                self._requeue(filepath, current_size)
                 continue
 
             # File is stable - safe to move
-            to_remove.append(filepath)
-            self.move_file(Path(filepath))
+            self._forget(filepath)
+            ready[Path(filepath)] = (filepath, current_size)
+
+        if ready:
+            with self._lock:
+                self._last_flush = time.monotonic_ns()
+            for path in self.move_files(list(ready)):
+                # Couldn't move it (e.g. still locked), try again later
+                filepath, size = ready[path]
+                self._requeue(filepath, size)
+
+    def _requeue(self, filepath: str, size: int, delay_ns: Optional[int] = None):
+        """
+        Check a pending file again later (event loop thread only).
 
-        # Clean up processed files from pending list
-        for filepath in to_remove:
+        Waits a full debounce period unless `delay_ns` is given.
+        """
+        if delay_ns is None:
+            delay_ns = self.debounce_ns
+
+        with self._lock:
+            deadline = time.monotonic_ns() + delay_ns
+            self.pending[filepath] = deadline
+            self.sizes[filepath] = size
+        self._schedule(filepath, deadline)
+
+    def _forget(self, filepath: str):
+        """Drop a file from the pending list."""
+        with self._lock:
             self.pending.pop(filepath, None)
+            self.sizes.pop(filepath, None)
 
-    def move_file(self, path: Path):
+    def move_files(self, paths: list[Path]) -> list[Path]:
         """
-        Move a file to its appropriate category folder.
+        Move files to their appropriate category folders.
 
         Args:
-            path: Path to the file to move
+            paths: Paths to the files to move
+
+        Returns:
+            The paths that couldn't be moved
 
-        The destination folder is determined by the file's extension.
+        The destination folder is determined by each file's extension.
         If no matching category is found, the file goes to "Other".
         Duplicate filenames are handled by appending _1, _2, etc.
+        Each category folder is created and listed once per batch, and
+        on_file_moved is called once with everything that was moved.
         """
-        ext = path.suffix.lower()
-        category = self.ext_map.get(ext, "Other")
-        dest_folder = self.watch_folder / category
+        by_name = {path.name: path for path in paths}
+        moved, failed = _move_to_categories(
+            self.watch_folder, list(by_name), self.ext_map, self.cat_folders
+        )
 
-        # Create category folder if it doesn't exist
-        dest_folder.mkdir(exist_ok=True)
-        dest_path = dest_folder / path.name
+        # Notify callback if provided
+        if self.on_file_moved and moved:
+            self.on_file_moved(moved)
 
-        # Handle duplicate filenames: file.pdf -> file_1.pdf -> file_2.pdf
-        if dest_path.exists():
-            stem = path.stem
-            counter = 1
-            while dest_path.exists():
-                dest_path = dest_folder / f"{stem}_{counter}{ext}"
-                counter += 1
+        return [by_name[name] for name in failed]
 
-        # Move the file
-        shutil.move(str(path), str(dest_path))
 
-        # Notify callback if provided
-        if self.on_file_moved:
-            self.on_file_moved(dest_path, category)
+class _LinuxInotifyBackend:
+    """
+    Minimal stand-in for watchdog's Observer on Linux, built on inotify_simple.
+
+    Only subscribes to the events Boop acts on: IN_CLOSE_WRITE fires exactly
+    when a download finishes writing, and IN_MOVED_FROM/IN_MOVED_TO catch
+    browsers renaming "file.pdf.crdownload" to "file.pdf". IN_MODIFY is never
+    requested, so an active download doesn't wake us up at all.
+
+    Events are delivered to the handler as regular watchdog events.
+    Raises ImportError if inotify_simple isn't installed.
+    """
+
+    def __init__(self):
+        from inotify_simple import INotify, flags
+
+        self._flags = flags
+        self._mask = flags.CREATE | flags.CLOSE_WRITE | flags.MOVED_FROM | flags.MOVED_TO
+        self._inotify = INotify()
+        self._watches: dict[int, tuple[str, FileSystemEventHandler]] = {}  # wd → (folder, handler)
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def schedule(self, handler: FileSystemEventHandler, path: str, recursive: bool = False):
+        """Watch the top level of a folder (recursive watching isn't supported)."""
+        wd = self._inotify.add_watch(path, self._mask)
+        self._watches[wd] = (path, handler)
+        # No IN_MODIFY, so the handler can't tell a new file is still being
+        # written until its close-write arrives
+        handler.modified_events = False
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        os.write(self._wake_w, b"\0")
+
+    def join(self):
+        self._thread.join()
+        self._inotify.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _run(self):
+        flags = self._flags
+        while True:
+            readable, _, _ = select.select([self._inotify, self._wake_r], [], [])
+            if self._wake_r in readable:
+                return
+
+            moved_from = {}  # cookie → source path, to pair up renames
+            for event in self._inotify.read(timeout=0):
+                if event.wd not in self._watches or not event.name:
+                    continue
+                folder, handler = self._watches[event.wd]
+                path = os.path.join(folder, event.name)
+                is_dir = bool(event.mask & flags.ISDIR)
+
+                if event.mask & flags.MOVED_FROM:
+                    moved_from[event.cookie] = path
+                elif event.mask & flags.MOVED_TO and event.cookie in moved_from:
+                    src = moved_from.pop(event.cookie)
+                    handler.dispatch((DirMovedEvent if is_dir else FileMovedEvent)(src, path))
+                elif event.mask & (flags.CREATE | flags.MOVED_TO):
+                    # Moved in from an unwatched folder counts as created, like watchdog
+                    handler.dispatch((DirCreatedEvent if is_dir else FileCreatedEvent)(path))
+                elif event.mask & flags.CLOSE_WRITE:
+                    handler.dispatch(FileClosedEvent(path))
 
 
 class Boop:
@@ -250,10 +643,12 @@ class Boop:
     Platform-specific UI (menu bar / system tray) is handled separately.
 
     Attributes:
-        config: Loaded configuration from config.yaml
+        config: Loaded configuration from config.toml
+        ext_map: Maps file extensions to category names
         watch_folder: Folder being monitored
+        cat_folders: Destination folder for each category
         handler: FileSystemEventHandler for watching files
-        observer: Watchdog observer running in background
+        observer: Watchdog observer (or inotify backend on Linux) running in background
         last_file: Most recently organized file
         on_file_moved: Callback when a file is organized
     """
@@ -263,54 +658,53 @@ class Boop:
         Initialize Boop.
 
         Args:
-            on_file_moved: Optional callback(path, category) when file is moved
+            on_file_moved: Optional callback([(path, category), ...]) when files are moved
         """
         self.config = load_config()
+        self.ext_map = build_extension_map(self.config["categories"])
         self.watch_folder = Path(self.config["watch_folder"]).expanduser()
+        self.cat_folders = build_category_folders(self.watch_folder, self.ext_map)
         self.on_file_moved = on_file_moved
         self.last_file: Optional[Path] = None
         self.observer: Optional[Observer] = None
         self.handler: Optional[DownloadHandler] = None
-        self._running = False
 
     def start(self):
         """Start watching for new downloads."""
-        ext_map = build_extension_map(self.config["categories"])
         debounce = 2  # seconds to wait after file stops changing
 
-        def file_moved_callback(path, category):
-            self.last_file = path
+        def file_moved_callback(moved):
+            self.last_file = moved[-1][0]
             if self.on_file_moved:
-                self.on_file_moved(path, category)
+                self.on_file_moved(moved)
 
         self.handler = DownloadHandler(
             self.watch_folder,
-            ext_map,
+            self.ext_map,
+            self.cat_folders,
             debounce,
             file_moved_callback
         )
 
-        self.observer = Observer()
-        self.observer.schedule(self.handler, str(self.watch_folder), recursive=False)
+        if get_platform() == "linux":
+            try:
+                self.observer = _LinuxInotifyBackend()
+            except ImportError:
+                self.observer = Observer()  # inotify_simple not installed
+        else:
+            self.observer = Observer()
+
+        self.observer.schedule(self.handler, self.handler.watch_folder_str, recursive=False)
+        self.handler.start()
         self.observer.start()
-        self._running = True
-
-        # Start background thread to process pending files
-        def process_loop():
-            while self._running:
-                if self.handler:
-                    self.handler.process_pending()
-                time.sleep(1)
-
-        thread = threading.Thread(target=process_loop, daemon=True)
-        thread.start()
 
     def stop(self):
         """Stop watching for downloads."""
-        self._running = False
         if self.observer:
             self.observer.stop()
             self.observer.join()
+        if self.handler:
+            self.handler.close()
 
     def reorganize_all(self) -> int:
         """
@@ -319,42 +713,28 @@ class Boop:
         Returns:
             Number of files organized
         """
-        ext_map = build_extension_map(self.config["categories"])
-        count = 0
+        names = []
+        with os.scandir(self.watch_folder) as it:
+            for entry in it:
+                # Skip folders and hidden files
+                if entry.name.startswith(".") or entry.is_dir():
+                    continue
 
-        for path in self.watch_folder.iterdir():
-            # Skip folders and hidden files
-            if path.is_dir() or path.name.startswith("."):
-                continue
-
-            ext = path.suffix.lower()
-
-            # Skip temporary download files (incomplete downloads)
-            if ext in TEMP_EXTENSIONS:
-                continue
+                # Skip temporary download files (incomplete downloads)
+                if _ext_of(entry.name) in TEMP_EXTENSIONS:
+                    continue
 
-            category = ext_map.get(ext, "Other")
-            dest_folder = self.watch_folder / category
+                names.append(entry.name)
 
-            dest_folder.mkdir(exist_ok=True)
-            dest_path = dest_folder / path.name
+        # Files that couldn't be moved stay where they are
+        moved, _ = _move_to_categories(self.watch_folder, names, self.ext_map, self.cat_folders)
 
-            # Handle duplicates
-            if dest_path.exists():
-                stem = path.stem
-                counter = 1
-                while dest_path.exists():
-                    dest_path = dest_folder / f"{stem}_{counter}{ext}"
-                    counter += 1
-
-            shutil.move(str(path), str(dest_path))
-            count += 1
-
-            self.last_file = dest_path
+        if moved:
+            self.last_file = moved[-1][0]
             if self.on_file_moved:
-                self.on_file_moved(dest_path, category)
+                self.on_file_moved(moved)
 
-        return count
+        return len(moved)
 
     def open_last_file(self):
         """Open the last organized file in the system file manager."""
@@ -370,10 +750,13 @@ class Boop:
 # CROSS-PLATFORM UTILITIES
 # =============================================================================
 
+@functools.cache
 def get_platform() -> str:
     """
     Get the current platform.
 
+    Cached: the answer can't change while Boop is running.
+
     Returns:
         'macos', 'windows', or 'linux'
     """
@@ -386,51 +769,117 @@ def get_platform() -> str:
         return "linux"
 
 
-def open_in_file_manager(path: Path):
-    """
-    Open a file or folder in the system's file manager.
+# Each platform gets its own open_in_file_manager / send_notification
+# backend. The right pair is picked once, at import time (see below), so
+# calls don't re-check the platform.
 
-    Args:
-        path: Path to file or folder to reveal
+def _open_in_finder(path: Path):
+    """Open Finder and select the file."""
+    subprocess.run(["open", "-R", str(path)])
 
-    On macOS: Opens Finder and selects the file
-    On Windows: Opens Explorer and selects the file
-    On Linux: Opens the default file manager
-    """
-    system = get_platform()
 
-    if system == "macos":
-        subprocess.run(["open", "-R", str(path)])
-    elif system == "windows":
-        subprocess.run(["explorer", "/select,", str(path)])
-    else:  # Linux
-        subprocess.run(["xdg-open", str(path.parent)])
+def _open_in_explorer(path: Path):
+    """Open Explorer and select the file."""
+    subprocess.run(["explorer", "/select,", str(path)])
 
 
-def send_notification(title: str, message: str):
-    """
-    Send a system notification.
+def _open_in_linux_file_manager(path: Path):
+    """Open the default file manager."""
+    subprocess.run(["xdg-open", str(path.parent)])
 
-    Args:
-        title: Notification title
-        message: Notification body text
-    """
-    system = get_platform()
 
-    if system == "macos":
-        # Use osascript for macOS notifications
-        script = f'display notification "{message}" with title "{title}"'
-        subprocess.run(["osascript", "-e", script])
-    elif system == "windows":
-        # Use PowerShell for Windows notifications
+# Spawning osascript or notify-send for every notification costs a fork+exec
+# each time, so each backend sets up something reusable on first use:
+#     - macOS: one interactive osascript process fed commands over stdin
+#     - Linux: libnotify through PyGObject (talks D-Bus, no subprocess)
+#     - Windows: one win10toast ToastNotifier
+# If that isn't possible the notification is sent the old way.
+
+_osascript: Optional[subprocess.Popen] = None
+_osascript_lock = threading.Lock()
+
+
+def _notify_macos(title: str, message: str):
+    """Send a notification through a long-lived osascript process."""
+    global _osascript
+
+    script = f'display notification "{_applescript_str(message)}" with title "{_applescript_str(title)}"'
+    with _osascript_lock:
+        try:
+            if _osascript is None or _osascript.poll() is not None:
+                _osascript = subprocess.Popen(
+                    ["osascript", "-i"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    text=True
+                )
+            _osascript.stdin.write(script + "\n")
+            _osascript.stdin.flush()
+        except OSError:
+            _osascript = None
+            subprocess.run(["osascript", "-e", script])
+
+
+@functools.cache
+def _toaster():
+    """The shared ToastNotifier, or None if win10toast isn't installed."""
+    try:
+        from win10toast import ToastNotifier
+    except ImportError:
+        return None
+    return ToastNotifier()
+
+
+def _notify_windows(title: str, message: str):
+    """Send a notification with win10toast."""
+    toaster = _toaster()
+    if toaster is not None:
+        toaster.show_toast(title, message, duration=3)
+
+
+@functools.cache
+def _libnotify():
+    """gi.repository.Notify, initialized, or None if PyGObject/libnotify is missing."""
+    try:
+        import gi
+        gi.require_version("Notify", "0.7")
+        from gi.repository import Notify
+    except (ImportError, ValueError):
+        return None
+    return Notify if Notify.init("Boop") else None
+
+
+def _notify_linux(title: str, message: str):
+    """Send a notification through libnotify, or notify-send if unavailable."""
+    notify = _libnotify()
+    if notify is not None:
         try:
-            from win10toast import ToastNotifier
-            toaster = ToastNotifier()
-            toaster.show_toast(title, message, duration=3)
-        except ImportError:
-            pass  # win10toast not installed
-    else:  # Linux
-        subprocess.run(["notify-send", title, message])
+            notify.Notification.new(title, message).show()
+            return
+        except Exception:
+            pass  # No notification daemon reachable, try notify-send
+
+    subprocess.run(["notify-send", title, message])
+
+
+def _applescript_str(text: str) -> str:
+    """Escape text for use inside a one-line AppleScript string literal."""
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+# open_in_file_manager(path): reveal a file or folder in the system's file manager
+# send_notification(title, message): show a system notification
+_system = get_platform()
+if _system == "macos":
+    open_in_file_manager = _open_in_finder
+    send_notification = _notify_macos
+elif _system == "windows":
+    open_in_file_manager = _open_in_explorer
+    send_notification = _notify_windows
+else:  # Linux
+    open_in_file_manager = _open_in_linux_file_manager
+    send_notification = _notify_linux
 
 
 # =============================================================================
@@ -473,8 +922,9 @@ def run_macos():
 
             self.boop.start()
 
-        def on_file_moved(self, path: Path, category: str):
-            """Called when a file is organized."""
+        def on_file_moved(self, moved: list[tuple[Path, str]]):
+            """Called when a batch of files is organized."""
+            path, category = moved[-1]
             name = path.name if len(path.name) <= 30 else path.name[:27] + "..."
             self.last_file_item.title = f"📄 {name} → {category}"
 
@@ -526,10 +976,17 @@ def run_windows_linux():
     boop = Boop()
     state = {"last_file": "No recent files"}
 
-    def on_file_moved(path: Path, category: str):
+    def on_file_moved(moved: list[tuple[Path, str]]):
+        path, category = moved[-1]
         name = path.name if len(path.name) <= 30 else path.name[:27] + "..."
         state["last_file"] = f"{name} → {category}"
-        send_notification("Boop", f"Booped: {name} → {category}")
+
+        if len(moved) == 1:
+            send_notification("Boop", f"Booped: {name} → {category}")
+        else:
+            counts = Counter(category for _, category in moved)
+            summary = ", ".join(f"{n} {category}" for category, n in counts.most_common())
+            send_notification("Boop", f"Booped {len(moved)} files ({summary})")
 
     boop.on_file_moved = on_file_moved
     boop.start()
@@ -541,8 +998,9 @@ def run_windows_linux():
         boop.open_downloads_folder()
 
     def reorganize(icon, item):
-        count = boop.reorganize_all()
-        send_notification("Boop", f"Booped {count} file(s) ✨")
+        # Moved files are already announced by on_file_moved
+        if boop.reorganize_all() == 0:
+            send_notification("Boop", "Booped 0 files ✨")
 
     def quit_app(icon, item):
         boop.stop()
@@ -2,12 +2,23 @@
 """Generate Boop app icon - magic wand with sparkles"""
 
 from PIL import Image, ImageDraw
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import subprocess
 import tempfile
 import math
 
 
+def star_coords(cx, cy, outer_r, inner_r, points=4):
+    """Polygon points for a star centered at (cx, cy)."""
+    coords = []
+    for i in range(points * 2):
+        angle = math.radians(i * 180 / points - 90)
+        r = outer_r if i % 2 == 0 else inner_r
+        coords.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return coords
+
+
 def create_icon(size: int) -> Image.Image:
     """Create a magic wand icon with sparkles."""
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
@@ -37,28 +48,20 @@ def create_icon(size: int) -> Image.Image:
     x2 = center + math.cos(rad) * wand_length / 2
     y2 = center + math.sin(rad) * wand_length / 2
 
-    # Draw wand body (slightly offset for thickness)
-    for offset in range(-wand_width // 2, wand_width // 2 + 1):
-        draw.line([(x1, y1 + offset), (x2, y2 + offset)], fill=(255, 248, 230), width=2)
+    # Draw wand body. Same thickness as the old stack of vertically offset
+    # 2px lines, which spanned about wand_width + 2 px vertically at -45°
+    body_width = max(2, round((wand_width + 2) * math.cos(math.radians(45))))
+    draw.line([(x1, y1), (x2, y2)], fill=(255, 248, 230), width=body_width)
 
     # Wand tip (star/sparkle)
     tip_x, tip_y = x2, y2
     star_size = size // 8
 
-    # Draw a 4-point star at the tip
-    def draw_star(cx, cy, outer_r, inner_r, points=4):
-        coords = []
-        for i in range(points * 2):
-            angle = math.radians(i * 180 / points - 90)
-            r = outer_r if i % 2 == 0 else inner_r
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            coords.append((x, y))
-        return coords
-
-    # Main star at wand tip
-    star_coords = draw_star(tip_x - size//12, tip_y - size//12, star_size, star_size // 3)
-    draw.polygon(star_coords, fill=(255, 255, 150))  # Yellow star
+    # Main 4-point star at wand tip
+    draw.polygon(
+        star_coords(tip_x - size//12, tip_y - size//12, star_size, star_size // 3),
+        fill=(255, 255, 150)  # Yellow star
+    )
 
     # Small sparkles around
     sparkle_positions = [
@@ -68,8 +71,7 @@ def create_icon(size: int) -> Image.Image:
     ]
 
     for sx, sy, sr in sparkle_positions:
-        small_star = draw_star(sx, sy, sr, sr // 2.5)
-        draw.polygon(small_star, fill=(255, 255, 200))
+        draw.polygon(star_coords(sx, sy, sr, sr // 2.5), fill=(255, 255, 200))
 
     # Tiny dots for extra magic
     dot_positions = [
@@ -91,10 +93,16 @@ def main():
         iconset = Path(tmpdir) / "AppIcon.iconset"
         iconset.mkdir()
 
-        # Create all required sizes
-        for s in [16, 32, 128, 256, 512]:
-            create_icon(s).save(iconset / f"icon_{s}x{s}.png")
-            create_icon(s * 2).save(iconset / f"icon_{s}x{s}@2x.png")
+        # Create all required sizes (@2x of one size is @1x of the next,
+        # so each pixel size is only drawn once)
+        base_sizes = [16, 32, 128, 256, 512]
+        pixel_sizes = sorted({px for s in base_sizes for px in (s, s * 2)})
+        with ThreadPoolExecutor() as pool:
+            icons = dict(zip(pixel_sizes, pool.map(create_icon, pixel_sizes)))
+
+        for s in base_sizes:
+            icons[s].save(iconset / f"icon_{s}x{s}.png")
+            icons[s * 2].save(iconset / f"icon_{s}x{s}@2x.png")
 
         # Convert to icns
         icns_path = output_dir / "AppIcon.icns"
@@ -15,7 +15,7 @@ python3 -m venv "$VENV_DIR"
 source "$VENV_DIR/bin/activate"
 
 # Install dependencies
-pip install watchdog pyyaml pystray Pillow --quiet
+pip install watchdog pystray Pillow inotify_simple "tomli; python_version < '3.11'" --quiet
 
 # Create desktop entry for autostart
 mkdir -p ~/.config/autostart
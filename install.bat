@@ -47,7 +47,7 @@ if errorlevel 1 (
 echo   Installing dependencies...
 call .venv\Scripts\activate.bat
 pip install --upgrade pip --quiet
-pip install watchdog pyyaml pystray Pillow --quiet
+pip install watchdog pystray Pillow "tomli; python_version < '3.11'" --quiet
 if errorlevel 1 (
     echo   ERROR: Failed to install dependencies.
     pause
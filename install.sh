@@ -41,7 +41,7 @@ source "$VENV_DIR/bin/activate"
 # Install dependencies
 echo "  Installing dependencies..."
 pip install --upgrade pip --quiet
-pip install watchdog pyyaml rumps Pillow --quiet
+pip install watchdog rumps Pillow "tomli; python_version < '3.11'" --quiet
 
 # Generate icon
 python "$PROJECT_DIR/icon.py"